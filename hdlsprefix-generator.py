@@ -14,6 +14,8 @@ load and improves ingest/list performance.
 """
 
 import argparse
+import asyncio
+import functools
 import hashlib
 import os
 import re
@@ -21,17 +23,23 @@ import sys
 import time
 import threading
 import itertools
+import json
+import tarfile
 import tempfile
 import random
-import string
 import warnings
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Tuple
 
 # Suppress urllib3 LibreSSL warning
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 
+import requests
+from requests.adapters import HTTPAdapter
 from azure.identity import DefaultAzureCredential
+from azure.core.pipeline.transport import RequestsTransport
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.mgmt.resource import ResourceManagementClient
 from azure.mgmt.storage import StorageManagementClient
@@ -40,7 +48,14 @@ from azure.mgmt.storage.models import (
     Sku,
     Kind,
 )
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import (
+    AccountSasPermissions,
+    BlobServiceClient,
+    ContainerClient,
+    ContentSettings,
+    ResourceTypes,
+    generate_account_sas,
+)
 
 
 # ==============================================================================
@@ -65,7 +80,10 @@ class Colors:
                 setattr(cls, attr, '')
 
 
-if not sys.stdout.isatty():
+# Checked once; stdout doesn't change between a TTY and a pipe mid-run
+STDOUT_IS_TTY = sys.stdout.isatty()
+
+if not STDOUT_IS_TTY:
     Colors.disable()
 
 
@@ -74,6 +92,8 @@ if not sys.stdout.isatty():
 # ==============================================================================
 class Spinner:
     FRAMES = ['|', '/', '-', '\\']
+    # Redraw interval; low enough that the thread barely competes with uploads
+    INTERVAL = 0.25
 
     def __init__(self, message: str = "Working"):
         self.message = message
@@ -82,17 +102,20 @@ class Spinner:
 
     def _animate(self):
         frames = itertools.cycle(self.FRAMES)
-        while not self._stop_event.is_set():
+        while True:
             frame = next(frames)
             sys.stdout.write(
                 f"\r{Colors.AZURE_ACCENT}{frame}{Colors.RESET} "
                 f"{Colors.AZURE_LIGHT}{self.message}{Colors.RESET}"
             )
             sys.stdout.flush()
-            time.sleep(0.1)
+            # Returns as soon as stop() is called rather than finishing a sleep
+            if self._stop_event.wait(self.INTERVAL):
+                break
 
     def start(self):
-        if sys.stdout.isatty():
+        # Off a TTY the spinner is a no-op apart from stop()'s final message
+        if STDOUT_IS_TTY:
             self._stop_event.clear()
             self._thread = threading.Thread(target=self._animate, daemon=True)
             self._thread.start()
@@ -101,7 +124,7 @@ class Spinner:
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=0.5)
-        if sys.stdout.isatty():
+        if STDOUT_IS_TTY:
             sys.stdout.write('\r' + ' ' * 80 + '\r')
             sys.stdout.flush()
         if message:
@@ -123,10 +146,58 @@ SKU_OPTIONS = {
     "8": ("Premium_ZRS", "Premium Zone-Redundant Storage"),
 }
 
+# Number of files uploaded in parallel (each upload is network-latency bound)
+UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "16"))
+
+# Parallel block uploads within a single blob, and the size of each block.
+# Blobs larger than one block are staged in blocks (the clients' single-put
+# limit is set to the same value), so max_concurrency applies to them.
+UPLOAD_MAX_CONCURRENCY = int(os.getenv("BLOB_MAX_CONCURRENCY", "8"))
+UPLOAD_BLOCK_SIZE = int(os.getenv("BLOB_BLOCK_SIZE", str(8 * 1024 * 1024)))
+
+# In-flight uploads for the --async path (coroutines are far cheaper than threads)
+ASYNC_UPLOAD_CONCURRENCY = int(os.getenv("ASYNC_UPLOAD_CONCURRENCY", "128"))
+
+# Threads reading (and content-hashing) files for the --async path; the event
+# loop's default executor is capped at min(32, cpus + 4)
+ASYNC_READ_WORKERS = int(os.getenv("ASYNC_READ_WORKERS", "64"))
+
+# Lifetime of the account SAS used for blob access when account keys are available
+SAS_EXPIRY_HOURS = int(os.getenv("SAS_EXPIRY_HOURS", "8"))
+
+# Test file counts at which generation is spread across a process pool
+TEST_FILES_PARALLEL_MIN = int(os.getenv("TEST_FILES_PARALLEL_MIN", "5000"))
+
+# Minimum seconds between progress-line redraws (~20 Hz)
+PROGRESS_INTERVAL = 0.05
+
+# Pooled HTTP connections for blob uploads; every file worker may run
+# UPLOAD_MAX_CONCURRENCY block uploads at once, so size the pool for both
+HTTP_POOL_SIZE = int(os.getenv(
+    "HTTP_POOL_SIZE", str(max(64, UPLOAD_CONCURRENCY * UPLOAD_MAX_CONCURRENCY))
+))
+
+# With --bundle, directories whose average file size is below this are uploaded
+# as a single tar blob instead of one request per file
+BUNDLE_THRESHOLD_BYTES = int(os.getenv("BUNDLE_THRESHOLD", str(1024 * 1024)))
+
+# What the hash prefix is derived from: "name" (filename) or "content" (file bytes)
+PREFIX_MODES = ("name", "content")
+PREFIX_MODE = os.getenv("PREFIX_MODE", "name").lower()
+
 
 # ==============================================================================
 # Prompts
 # ==============================================================================
+# Azure naming rules, compiled once and applied with fullmatch()
+# Storage account: 3-24 chars, lowercase alphanumeric only
+_ACCOUNT_RE = re.compile(r'[a-z0-9]{3,24}')
+# Resource group: 1-90 chars, alphanumeric, underscores, hyphens, periods
+_RG_RE = re.compile(r'[a-zA-Z0-9._-]{1,90}')
+# Container: 3-63 chars, lowercase, numbers, hyphens (no leading/trailing or consecutive hyphens)
+_CONTAINER_RE = re.compile(r'(?!.*--)[a-z0-9][a-z0-9-]{1,61}[a-z0-9]')
+
+
 def prompt(label: str, default: str = "", required: bool = True) -> str:
     """Prompt user for input with optional default."""
     if default:
@@ -206,8 +277,7 @@ def prompt_storage_account_name(label: str, default: str = "") -> str:
     """Prompt for storage account name with validation."""
     while True:
         value = prompt(label, default)
-        # Rules: 3-24 chars, lowercase alphanumeric only
-        if re.match(r'^[a-z0-9]{3,24}$', value):
+        if _ACCOUNT_RE.fullmatch(value):
             return value
         print(f"  {Colors.ERROR}! Must be 3-24 lowercase alphanumeric characters{Colors.RESET}")
 
@@ -216,8 +286,7 @@ def prompt_resource_group_name(label: str, default: str = "") -> str:
     """Prompt for resource group name with validation."""
     while True:
         value = prompt(label, default)
-        # Rules: 1-90 chars, alphanumeric, underscores, hyphens, periods
-        if re.match(r'^[a-zA-Z0-9._-]{1,90}$', value):
+        if _RG_RE.fullmatch(value):
             return value
         print(f"  {Colors.ERROR}! Must be 1-90 alphanumeric, underscore, hyphen, or period chars{Colors.RESET}")
 
@@ -226,16 +295,35 @@ def prompt_container_name(label: str, default: str = "") -> str:
     """Prompt for container name with validation."""
     while True:
         value = prompt(label, default)
-        # Rules: 3-63 chars, lowercase, numbers, hyphens (no consecutive hyphens)
-        if re.match(r'^[a-z0-9]([a-z0-9-]*[a-z0-9])?$', value) and len(value) >= 3 and len(value) <= 63:
-            if '--' not in value:
-                return value
+        if _CONTAINER_RE.fullmatch(value):
+            return value
         print(f"  {Colors.ERROR}! Must be 3-63 lowercase alphanumeric with hyphens (no consecutive hyphens){Colors.RESET}")
 
 
 # ==============================================================================
 # Hash Prefix Generator
 # ==============================================================================
+def _hash_constructor(name: str):
+    """
+    Bind a hashlib constructor once, flagged usedforsecurity=False when supported.
+
+    None of the hashes here are security-sensitive; the flag lets MD5 work on
+    FIPS-mode OpenSSL builds and skips its policy checks.
+    """
+    constructor = getattr(hashlib, name)
+    try:
+        constructor(usedforsecurity=False)
+    except TypeError:
+        # Python < 3.9
+        return constructor
+    return functools.partial(constructor, usedforsecurity=False)
+
+
+_blake2b = hashlib.blake2b
+_sha256 = _hash_constructor('sha256')
+_md5 = _hash_constructor('md5')
+
+
 def generate_hash_prefix(filename: str, depth: int = 2, chars_per_level: int = 2) -> str:
     """
     Generate a hash prefix for a filename to improve blob distribution.
@@ -248,16 +336,22 @@ def generate_hash_prefix(filename: str, depth: int = 2, chars_per_level: int = 2
     Returns:
         Hash prefix path (e.g., "a3/f7/" for depth=2, chars_per_level=2)
     """
-    # Use MD5 hash of filename for consistent distribution
-    hash_hex = hashlib.md5(filename.encode('utf-8')).hexdigest()
+    # BLAKE2b sized to just the hex chars needed: a single compression round
+    # that is cheaper than MD5/SHA-256 and equally well distributed
+    digest_size = (depth * chars_per_level + 1) // 2 or 1
+    hash_hex = _blake2b(filename.encode('utf-8'), digest_size=digest_size).hexdigest()
 
-    prefix_parts = []
-    for i in range(depth):
-        start = i * chars_per_level
-        end = start + chars_per_level
-        prefix_parts.append(hash_hex[start:end])
+    return _format_prefix(hash_hex, depth, chars_per_level)
 
-    return '/'.join(prefix_parts) + '/'
+
+def _format_prefix(hash_hex: str, depth: int, chars_per_level: int) -> str:
+    """Split a hex digest into depth levels of chars_per_level each."""
+    if depth == 2 and chars_per_level == 2:
+        # Default layout (aa/bb/): build it directly
+        return f"{hash_hex[0:2]}/{hash_hex[2:4]}/"
+
+    end = depth * chars_per_level
+    return '/'.join([hash_hex[i:i + chars_per_level] for i in range(0, end, chars_per_level)]) + '/'
 
 
 def get_prefixed_blob_name(filename: str, depth: int = 2, chars_per_level: int = 2) -> str:
@@ -266,28 +360,156 @@ def get_prefixed_blob_name(filename: str, depth: int = 2, chars_per_level: int =
     return prefix + filename
 
 
+def make_blob_namer(depth: int = 2, chars_per_level: int = 2):
+    """
+    Build a function mapping a filename to its prefixed blob name for one layout.
+
+    The digest size and slice boundaries are fixed once here, so the returned
+    function only hashes and slices. Equivalent to get_prefixed_blob_name.
+    """
+    digest_size = (depth * chars_per_level + 1) // 2 or 1
+    blake2b = _blake2b
+
+    if depth == 2 and chars_per_level == 2:
+        def name(filename: str) -> str:
+            h = blake2b(filename.encode('utf-8'), digest_size=digest_size).hexdigest()
+            return f"{h[0:2]}/{h[2:4]}/{filename}"
+        return name
+
+    slices = tuple(slice(i, i + chars_per_level) for i in range(0, depth * chars_per_level, chars_per_level))
+
+    def name(filename: str) -> str:
+        h = blake2b(filename.encode('utf-8'), digest_size=digest_size).hexdigest()
+        return '/'.join([h[s] for s in slices]) + '/' + filename
+    return name
+
+
+def _file_digest(local_path: str, hash_factory):
+    """Hash file contents in fixed-size chunks without reading it all into memory."""
+    with open(local_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read/update loop runs entirely in C
+            return hashlib.file_digest(f, hash_factory)
+
+        hasher = hash_factory()
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+        return hasher
+
+
+def local_md5(local_path: str) -> bytes:
+    """MD5 of file contents, in the raw form Azure stores as Content-MD5."""
+    return _file_digest(local_path, _md5).digest()
+
+
+def content_prefix(local_path: str, depth: int = 2, chars_per_level: int = 2) -> str:
+    """Generate a hash prefix from file contents instead of the filename."""
+    hash_hex = _file_digest(local_path, _sha256).hexdigest()
+    return _format_prefix(hash_hex, depth, chars_per_level)
+
+
+def get_blob_name_for_file(local_path: str, depth: int = 2, chars_per_level: int = 2) -> str:
+    """Get the full blob name for a local file according to PREFIX_MODE."""
+    filename = os.path.basename(local_path)
+    if PREFIX_MODE == "content":
+        return content_prefix(local_path, depth, chars_per_level) + filename
+    return get_prefixed_blob_name(filename, depth, chars_per_level)
+
+
+def precompute_blob_names(
+    local_paths: List[str],
+    depth: int = 2,
+    chars_per_level: int = 2
+) -> List[Optional[str]]:
+    """
+    Compute blob names for a batch of files up front so upload workers only do I/O.
+
+    Returns:
+        Blob names aligned with local_paths; entries are None in content mode,
+        where hashing needs a file read and is left to the upload workers
+    """
+    if PREFIX_MODE == "content":
+        return [None] * len(local_paths)
+
+    namer = make_blob_namer(depth, chars_per_level)
+    basename = os.path.basename
+    return [namer(basename(local_path)) for local_path in local_paths]
+
+
+# ==============================================================================
+# Local Files
+# ==============================================================================
+def list_files(directory: str) -> List[Path]:
+    """
+    List regular files directly inside a directory, sorted by name.
+
+    os.scandir returns the file type with each directory entry, so no
+    per-file stat() is needed to filter out subdirectories.
+    """
+    with os.scandir(directory) as entries:
+        return [Path(e.path) for e in sorted(entries, key=lambda e: e.name) if e.is_file()]
+
+
 # ==============================================================================
 # Test File Generation
 # ==============================================================================
-def generate_test_files(directory: str, count: int = 100) -> List[str]:
-    """Generate test files in the specified directory."""
-    os.makedirs(directory, exist_ok=True)
+def _generate_test_file_range(directory: str, start: int, stop: int) -> List[str]:
+    """Write test files numbered start..stop-1; runs in a worker process for large counts."""
+    # Fresh OS-seeded generator so forked workers don't share random state
+    rng = random.Random()
     files = []
 
-    extensions = ['.parquet', '.csv', '.json', '.txt', '.xml']
+    extensions = ('.parquet', '.csv', '.json', '.txt', '.xml')
 
-    for i in range(count):
-        ext = random.choice(extensions)
-        filename = f"testfile_{i:04d}{ext}"
-        filepath = os.path.join(directory, filename)
+    # Random bytes for up to 1024 files come from one os.urandom call and are
+    # written as slices, so every file is distinct without a syscall per file
+    for batch_start in range(start, stop, 1024):
+        batch = range(batch_start, min(batch_start + 1024, stop))
+        sizes = [rng.randint(100, 1000) for _ in batch]
+        pool = memoryview(os.urandom(sum(sizes)))
 
-        # Generate random content
-        content = ''.join(random.choices(string.ascii_letters + string.digits, k=random.randint(100, 1000)))
+        offset = 0
+        for i, size in zip(batch, sizes):
+            ext = rng.choice(extensions)
+            filename = f"testfile_{i:04d}{ext}"
+            filepath = os.path.join(directory, filename)
 
-        with open(filepath, 'w') as f:
-            f.write(content)
+            with open(filepath, 'wb') as f:
+                f.write(pool[offset:offset + size])
+            offset += size
 
-        files.append(filepath)
+            files.append(filepath)
+
+    return files
+
+
+def generate_test_files(directory: str, count: int = 100) -> List[str]:
+    """
+    Generate test files in the specified directory.
+
+    Counts of TEST_FILES_PARALLEL_MIN or more are split into contiguous ranges
+    written by a process pool; smaller counts finish faster than the pool starts.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    workers = os.cpu_count() or 1
+    if count < TEST_FILES_PARALLEL_MIN or workers == 1:
+        return _generate_test_file_range(directory, 0, count)
+
+    step = -(-count // workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_generate_test_file_range, directory, start, min(start + step, count))
+            for start in range(0, count, step)
+        ]
+        files = []
+        for future in futures:
+            files.extend(future.result())
 
     return files
 
@@ -295,6 +517,89 @@ def generate_test_files(directory: str, count: int = 100) -> List[str]:
 # ==============================================================================
 # Azure Operations
 # ==============================================================================
+class CachedCredential:
+    """
+    Token credential wrapper that reuses access tokens per scope until near expiry.
+
+    Each SDK client asks its credential for a token independently, and
+    AzureCliCredential shells out to `az` on every request; caching here means
+    clients sharing a scope pay for that once.
+    """
+
+    # Fetch a fresh token once the cached one has less than this many seconds left
+    REFRESH_MARGIN = 300
+
+    def __init__(self, inner):
+        self._inner = inner
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes, claims=None, tenant_id=None, **kwargs):
+        if claims:
+            # Claims challenges need a fresh token from the inner credential
+            return self._inner.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+
+        key = (scopes, tenant_id)
+        with self._lock:
+            token = self._cache.get(key)
+            if token is None or token.expires_on - time.time() <= self.REFRESH_MARGIN:
+                token = self._inner.get_token(*scopes, tenant_id=tenant_id, **kwargs)
+                self._cache[key] = token
+            return token
+
+    def close(self):
+        self._inner.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_credential() -> CachedCredential:
+    """
+    Return the process-wide credential.
+
+    DefaultAzureCredential walks its chain (environment, managed identity,
+    CLI, ...) on first use, so every client shares one instance, and tokens
+    are cached per scope across clients.
+    """
+    return CachedCredential(DefaultAzureCredential(exclude_interactive_browser_credential=True))
+
+
+def build_transport(pool_size: int = HTTP_POOL_SIZE) -> RequestsTransport:
+    """
+    Build a requests transport whose connection pool fits the upload concurrency.
+
+    The SDK default keeps 10 connections per host, which silently serializes
+    threaded uploads beyond that.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_transport() -> RequestsTransport:
+    """
+    Return the transport shared by every sync client in the process.
+
+    Management and data-plane clients reuse its pooled connections, so each
+    host pays the TCP and TLS handshake once.
+    """
+    return build_transport()
+
+
+@functools.lru_cache(maxsize=None)
+def get_blob_service(account_url: str, credential) -> BlobServiceClient:
+    """Return a BlobServiceClient shared by all callers for the same account and credential."""
+    return BlobServiceClient(
+        account_url=account_url,
+        credential=credential,
+        transport=get_transport(),
+        max_block_size=UPLOAD_BLOCK_SIZE,
+        max_single_put_size=UPLOAD_BLOCK_SIZE
+    )
+
+
 def resource_group_exists(
     client: ResourceManagementClient,
     resource_group: str
@@ -366,6 +671,22 @@ def create_storage_account(
     poller.result()
 
 
+def create_account_sas(account_name: str, account_key: str) -> str:
+    """
+    Sign an account SAS for the blob operations this script performs.
+
+    Signed locally from the account key; requests then carry the SAS in the
+    query string instead of being HMAC-signed one by one with the key.
+    """
+    return generate_account_sas(
+        account_name,
+        account_key,
+        resource_types=ResourceTypes(service=True, container=True, object=True),
+        permission=AccountSasPermissions(read=True, write=True, list=True, create=True),
+        expiry=datetime.now(timezone.utc) + timedelta(hours=SAS_EXPIRY_HOURS),
+    )
+
+
 def container_exists(
     blob_service: BlobServiceClient,
     container_name: str
@@ -387,36 +708,140 @@ def list_containers(blob_service: BlobServiceClient) -> List[str]:
 def create_container(
     blob_service: BlobServiceClient,
     container_name: str
-) -> None:
-    """Create container with private access (no public access)."""
+) -> bool:
+    """
+    Create container with private access (no public access).
+
+    Creation is attempted directly and a 409 conflict means the container is
+    already there, so no separate existence check is needed.
+
+    Returns:
+        True if the container was created, False if it already existed
+    """
     try:
         blob_service.create_container(name=container_name)
+        return True
     except ResourceExistsError:
-        pass
+        return False
+
+
+def _blob_matches(props, size: int, md5: bytes) -> bool:
+    """Check whether existing blob properties match a local file's size and MD5."""
+    stored_md5 = props.content_settings.content_md5
+    return props.size == size and stored_md5 is not None and bytes(stored_md5) == md5
 
 
 def upload_file_with_prefix(
-    blob_service: BlobServiceClient,
-    container_name: str,
+    container_client: ContainerClient,
     local_path: str,
     depth: int = 2,
-    chars_per_level: int = 2
-) -> Tuple[str, str]:
+    chars_per_level: int = 2,
+    blob_name: Optional[str] = None,
+    skip_unchanged: bool = False
+) -> Tuple[str, str, bool]:
     """
     Upload a file with hash prefix to improve partition distribution.
 
+    Args:
+        container_client: Client for the target container, shared across uploads
+        blob_name: Precomputed blob name (see precompute_blob_names); derived
+            from the file when omitted
+        skip_unchanged: Skip the upload when the blob already has the same
+            size and Content-MD5 as the local file
+
     Returns:
-        Tuple of (local_path, blob_name)
+        Tuple of (local_path, blob_name, skipped) where skipped is True when
+        the blob was left as is because it was unchanged
     """
-    filename = os.path.basename(local_path)
-    blob_name = get_prefixed_blob_name(filename, depth, chars_per_level)
+    if blob_name is None:
+        blob_name = get_blob_name_for_file(local_path, depth, chars_per_level)
 
-    blob_client = blob_service.get_blob_client(container=container_name, blob=blob_name)
+    blob_client = container_client.get_blob_client(blob_name)
+    size = os.path.getsize(local_path)
+
+    content_settings = None
+    if skip_unchanged:
+        md5 = local_md5(local_path)
+        try:
+            if _blob_matches(blob_client.get_blob_properties(), size, md5):
+                return (local_path, blob_name, True)
+        except ResourceNotFoundError:
+            pass
+        # Store the MD5 so the next run can compare against it
+        content_settings = ContentSettings(content_md5=md5)
 
     with open(local_path, 'rb') as data:
-        blob_client.upload_blob(data, overwrite=True)
+        blob_client.upload_blob(
+            data,
+            length=size,
+            overwrite=True,
+            content_settings=content_settings,
+            max_concurrency=UPLOAD_MAX_CONCURRENCY
+        )
+
+    return (local_path, blob_name, False)
+
+
+def should_bundle(local_paths: List[str]) -> bool:
+    """Check whether files are small enough on average to upload as one bundle."""
+    if len(local_paths) < 2:
+        return False
+    total_size = sum(os.path.getsize(p) for p in local_paths)
+    return total_size / len(local_paths) < BUNDLE_THRESHOLD_BYTES
+
+
+def upload_bundle(
+    container_client: ContainerClient,
+    local_paths: List[str],
+    depth: int = 2,
+    chars_per_level: int = 2
+) -> Tuple[str, str]:
+    """
+    Upload many small files as a single tar blob plus a JSON manifest.
+
+    Each file is stored in the tar under its hash-prefixed blob name, so
+    extracting the bundle reproduces the layout of a per-file upload. The
+    manifest blob ({bundle}.manifest.json) maps original filenames to members.
+
+    Returns:
+        Tuple of (bundle_blob_name, manifest_blob_name)
+    """
+    blob_names = precompute_blob_names(local_paths, depth, chars_per_level)
+    members = []
+    for local_path, blob_name in zip(local_paths, blob_names):
+        if blob_name is None:
+            blob_name = get_blob_name_for_file(local_path, depth, chars_per_level)
+        members.append((local_path, blob_name))
+
+    bundle_file = f"batch-{time.strftime('%Y%m%dT%H%M%S')}.tar"
+    bundle_blob = get_prefixed_blob_name(bundle_file, depth, chars_per_level)
+
+    # Spill to disk only once the tar outgrows memory
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as spooled:
+        with tarfile.open(fileobj=spooled, mode='w|') as tar:
+            for local_path, member_name in members:
+                tar.add(local_path, arcname=member_name)
+        length = spooled.tell()
+        spooled.seek(0)
+
+        container_client.get_blob_client(bundle_blob).upload_blob(
+            spooled,
+            length=length,
+            overwrite=True,
+            max_concurrency=UPLOAD_MAX_CONCURRENCY
+        )
 
-    return (local_path, blob_name)
+    manifest = {
+        "bundle": bundle_blob,
+        "files": {os.path.basename(p): name for p, name in members},
+    }
+    manifest_blob = bundle_blob + ".manifest.json"
+    container_client.get_blob_client(manifest_blob).upload_blob(
+        json.dumps(manifest, indent=2).encode('utf-8'),
+        overwrite=True
+    )
+
+    return (bundle_blob, manifest_blob)
 
 
 def upload_directory(
@@ -425,32 +850,218 @@ def upload_directory(
     source_dir: str,
     depth: int = 2,
     chars_per_level: int = 2,
-    progress_callback=None
-) -> List[Tuple[str, str]]:
+    progress_callback=None,
+    max_workers: int = UPLOAD_CONCURRENCY,
+    skip_unchanged: bool = False
+) -> List[Tuple[str, str, bool]]:
     """
     Upload all files from a directory with hash prefixes.
 
+    Files are uploaded in parallel on a thread pool; a single ContainerClient
+    is built up front and shared across threads.
+
     Returns:
-        List of (local_path, blob_name) tuples
+        List of (local_path, blob_name, skipped) tuples
     """
     uploaded = []
-    files = [f for f in Path(source_dir).iterdir() if f.is_file()]
+    files = list_files(source_dir)
     total = len(files)
+    blob_names = precompute_blob_names([str(f) for f in files], depth, chars_per_level)
+    container_client = blob_service.get_container_client(container_name)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                upload_file_with_prefix,
+                container_client,
+                str(filepath),
+                depth,
+                chars_per_level,
+                blob_name,
+                skip_unchanged
+            ): filepath
+            for filepath, blob_name in zip(files, blob_names)
+        }
+
+        for i, future in enumerate(as_completed(futures)):
+            uploaded.append(future.result())
+
+            if progress_callback:
+                progress_callback(i + 1, total, futures[future].name)
+
+    return uploaded
+
+
+async def _read_blocks(local_path: str, read_executor: Optional[ThreadPoolExecutor]):
+    """Yield a file in UPLOAD_BLOCK_SIZE pieces, each read on read_executor."""
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(read_executor, open, local_path, 'rb')
+    try:
+        while True:
+            block = await loop.run_in_executor(read_executor, f.read, UPLOAD_BLOCK_SIZE)
+            if not block:
+                return
+            yield block
+    finally:
+        f.close()
 
-    for i, filepath in enumerate(files):
-        result = upload_file_with_prefix(
-            blob_service,
-            container_name,
-            str(filepath),
-            depth,
-            chars_per_level
+
+async def _upload_file_with_prefix_async(
+    container_client,
+    local_path: str,
+    depth: int,
+    chars_per_level: int,
+    semaphore: asyncio.Semaphore,
+    block_semaphore: asyncio.Semaphore,
+    blob_name: Optional[str] = None,
+    skip_unchanged: bool = False,
+    read_executor: Optional[ThreadPoolExecutor] = None
+) -> Tuple[str, str, bool]:
+    """
+    Async counterpart of upload_file_with_prefix, bounded by a semaphore.
+
+    Files staged in blocks also hold block_semaphore while uploading, since
+    each keeps up to UPLOAD_MAX_CONCURRENCY blocks in memory at once.
+    """
+    async with semaphore:
+        # Read (and content-hash) off the event loop so file I/O doesn't stall other uploads
+        loop = asyncio.get_running_loop()
+        if blob_name is None:
+            blob_name = await loop.run_in_executor(
+                read_executor, get_blob_name_for_file, local_path, depth, chars_per_level
+            )
+        size = os.path.getsize(local_path)
+        # Single-PUT files are read whole; larger ones are streamed block by block
+        data = None
+        if size <= UPLOAD_BLOCK_SIZE:
+            data = await loop.run_in_executor(read_executor, Path(local_path).read_bytes)
+        blob_client = container_client.get_blob_client(blob_name)
+
+        content_settings = None
+        if skip_unchanged:
+            if data is not None:
+                md5 = _md5(data).digest()
+            else:
+                md5 = await loop.run_in_executor(read_executor, local_md5, local_path)
+            try:
+                if _blob_matches(await blob_client.get_blob_properties(), size, md5):
+                    return (local_path, blob_name, True)
+            except ResourceNotFoundError:
+                pass
+            content_settings = ContentSettings(content_md5=md5)
+
+        upload_options = dict(
+            length=size,
+            overwrite=True,
+            content_settings=content_settings,
+            max_concurrency=UPLOAD_MAX_CONCURRENCY
         )
-        uploaded.append(result)
+        if data is None:
+            # The aio SDK reads sync file objects on the event loop thread, so
+            # hand it an async generator whose reads run on read_executor
+            async with block_semaphore:
+                await blob_client.upload_blob(
+                    _read_blocks(local_path, read_executor), **upload_options
+                )
+        else:
+            await blob_client.upload_blob(data, **upload_options)
 
-        if progress_callback:
-            progress_callback(i + 1, total, filepath.name)
+    return (local_path, blob_name, False)
 
-    return uploaded
+
+async def upload_files_async(
+    account_url: str,
+    credential,
+    container_name: str,
+    local_paths: List[str],
+    depth: int = 2,
+    chars_per_level: int = 2,
+    progress_callback=None,
+    max_workers: int = ASYNC_UPLOAD_CONCURRENCY,
+    skip_unchanged: bool = False
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Upload files with hash prefixes using the asyncio SDK client.
+
+    A single async client is shared by all uploads; an asyncio.Semaphore
+    caps the number in flight. Files larger than one block are further
+    capped at UPLOAD_CONCURRENCY, as in the threaded path, so peak memory
+    stays near UPLOAD_CONCURRENCY * UPLOAD_MAX_CONCURRENCY blocks rather
+    than scaling with max_workers. Requires aiohttp.
+
+    Args:
+        credential: SAS token or account key string, or None/any token credential to use
+            the async DefaultAzureCredential
+
+    Returns:
+        Tuple of (uploaded, skipped, errors) where uploaded and skipped (blobs left
+        unchanged under skip_unchanged) hold (local_path, blob_name) and errors
+        holds (filename, error message)
+    """
+    import aiohttp
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+
+    async_credential = None
+    if not isinstance(credential, str):
+        # Sync token credentials can't be awaited; use the aio equivalent
+        from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+        async_credential = AsyncDefaultAzureCredential()
+        credential = async_credential
+
+    uploaded = []
+    skipped = []
+    errors = []
+    total = len(local_paths)
+    blob_names = precompute_blob_names(local_paths, depth, chars_per_level)
+    semaphore = asyncio.Semaphore(max_workers)
+    block_semaphore = asyncio.Semaphore(min(max_workers, UPLOAD_CONCURRENCY))
+
+    # Same connection budget as the sync pool; scaling it with the fan-out
+    # could exhaust the process's file descriptors
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE)
+    )
+    transport = AioHttpTransport(session=session, session_owner=False)
+    read_executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, ASYNC_READ_WORKERS), thread_name_prefix="file-read"
+    )
+
+    try:
+        async with AsyncBlobServiceClient(
+            account_url=account_url,
+            credential=credential,
+            transport=transport,
+            max_block_size=UPLOAD_BLOCK_SIZE,
+            max_single_put_size=UPLOAD_BLOCK_SIZE
+        ) as blob_service:
+            container_client = blob_service.get_container_client(container_name)
+
+            async def upload_one(local_path: str, blob_name: Optional[str]):
+                filename = os.path.basename(local_path)
+                try:
+                    local_path, blob_name, was_skipped = await _upload_file_with_prefix_async(
+                        container_client, local_path, depth, chars_per_level, semaphore,
+                        block_semaphore, blob_name, skip_unchanged, read_executor
+                    )
+                    (skipped if was_skipped else uploaded).append((local_path, blob_name))
+                except Exception as e:
+                    errors.append((filename, str(e)))
+
+                if progress_callback:
+                    progress_callback(len(uploaded) + len(skipped) + len(errors), total, filename)
+
+            await asyncio.gather(*(
+                upload_one(local_path, blob_name)
+                for local_path, blob_name in zip(local_paths, blob_names)
+            ))
+    finally:
+        read_executor.shutdown(wait=False)
+        await session.close()
+        if async_credential is not None:
+            await async_credential.close()
+
+    return uploaded, skipped, errors
 
 
 # ==============================================================================
@@ -477,7 +1088,41 @@ Examples:
         required=True,
         help="Azure resource group name (must already exist)"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Upload with the asyncio SDK client (requires aiohttp)"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Upload small files as a single tar blob with a JSON manifest"
+    )
+    parser.add_argument(
+        "--list-existing",
+        action="store_true",
+        help="List storage accounts and containers when choosing existing ones"
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip files whose blob already has the same size and MD5"
+    )
+    parser.add_argument(
+        "--test-files",
+        type=int,
+        default=100,
+        metavar="N",
+        help="Number of test files to generate when no source files are given (default: 100)"
+    )
+    args = parser.parse_args()
+    if args.test_files < 1:
+        parser.error("--test-files must be at least 1")
+    if args.bundle and (args.use_async or args.skip_unchanged):
+        # The bundle is one tar upload; per-file async or skip logic doesn't apply
+        parser.error("--bundle cannot be combined with --async or --skip-unchanged")
+    return args
 
 
 def main():
@@ -485,7 +1130,11 @@ def main():
     subscription_id = args.subscription_id
     resource_group = args.resource_group
 
-    print(f"""
+    if PREFIX_MODE not in PREFIX_MODES:
+        print(f"  {Colors.ERROR}! PREFIX_MODE must be one of: {', '.join(PREFIX_MODES)}{Colors.RESET}")
+        sys.exit(1)
+
+    banner = f"""
 {Colors.AZURE_LIGHT}              _   _                              _   _
 {Colors.AZURE_MID}          ,--'   '--,                          ,--'   '--,
 {Colors.AZURE_LIGHT}       .-'          '-.______________________.-'          '-.
@@ -494,11 +1143,16 @@ def main():
 {Colors.AZURE_MID}      (                        📦 🔗 ☁️                        )
 {Colors.AZURE_LIGHT}       '-._                                              _.-'
 {Colors.AZURE_MID}           '---------------------------------------------'{Colors.RESET}
-""")
+"""
 
-    print(f"  {Colors.AZURE_LIGHT}Configuration{Colors.RESET}")
-    print(f"  {Colors.DIM}Subscription: {subscription_id}{Colors.RESET}")
-    print(f"  {Colors.DIM}Resource Group: {resource_group}{Colors.RESET}\n")
+    # Emit the banner and configuration block as a single write
+    sys.stdout.write(
+        f"{banner}\n"
+        f"  {Colors.AZURE_LIGHT}Configuration{Colors.RESET}\n"
+        f"  {Colors.DIM}Subscription: {subscription_id}{Colors.RESET}\n"
+        f"  {Colors.DIM}Resource Group: {resource_group}{Colors.RESET}\n\n"
+    )
+    sys.stdout.flush()
 
     # ---------------------------------------------------------------------------
     # Authenticate
@@ -506,9 +1160,9 @@ def main():
     sp = Spinner("Authenticating with Azure")
     sp.start()
     try:
-        credential = DefaultAzureCredential()
-        resource_client = ResourceManagementClient(credential, subscription_id)
-        storage_client = StorageManagementClient(credential, subscription_id)
+        credential = get_credential()
+        resource_client = ResourceManagementClient(credential, subscription_id, transport=get_transport())
+        storage_client = StorageManagementClient(credential, subscription_id, transport=get_transport())
         sp.stop(success=True, message="Authenticated")
     except Exception as e:
         sp.stop(success=False, message=f"Authentication failed: {e}")
@@ -517,9 +1171,23 @@ def main():
     # ---------------------------------------------------------------------------
     # Verify Resource Group Exists
     # ---------------------------------------------------------------------------
+    # Started in the background so the check (and the first token fetch it
+    # triggers) overlaps with the user answering the storage account prompt
+    probe_executor = ThreadPoolExecutor(max_workers=2)
+    rg_future = probe_executor.submit(resource_group_exists, resource_client, resource_group)
+    sa_list_future = None
+    if args.list_existing:
+        sa_list_future = probe_executor.submit(list_storage_accounts, storage_client, resource_group)
+    probe_executor.shutdown(wait=False)
+
+    # ---------------------------------------------------------------------------
+    # Storage Account
+    # ---------------------------------------------------------------------------
+    sa_action = prompt_create_or_use("Storage Account")
+
     sp = Spinner(f"Verifying resource group '{resource_group}'")
     sp.start()
-    if not resource_group_exists(resource_client, resource_group):
+    if not rg_future.result():
         sp.stop(success=False, message=f"Resource group '{resource_group}' not found")
         print(f"  {Colors.ERROR}! The specified resource group does not exist.{Colors.RESET}")
         print(f"  {Colors.DIM}Create it first with: az group create --name {resource_group} --location <region>{Colors.RESET}")
@@ -527,28 +1195,34 @@ def main():
     sp.stop(success=True)
     rg_location = None  # Will get from storage account if needed
 
-    # ---------------------------------------------------------------------------
-    # Storage Account
-    # ---------------------------------------------------------------------------
-    sa_action = prompt_create_or_use("Storage Account")
+    # ARM existence probes, remembered so the create path doesn't repeat them
+    sa_exists_cache = {}
+
+    def sa_exists(name: str) -> bool:
+        if name not in sa_exists_cache:
+            sa_exists_cache[name] = storage_account_exists(storage_client, resource_group, name)
+        return sa_exists_cache[name]
 
     if sa_action == "existing":
-        # List existing storage accounts
-        sp = Spinner("Fetching storage accounts")
-        sp.start()
-        sa_list = list_storage_accounts(storage_client, resource_group)
-        sp.stop(success=True, message=f"Found {len(sa_list)} storage accounts")
+        if args.list_existing:
+            # List existing storage accounts
+            sp = Spinner("Fetching storage accounts")
+            sp.start()
+            sa_list = sa_list_future.result()
+            sp.stop(success=True, message=f"Found {len(sa_list)} storage accounts")
 
-        if sa_list:
-            print(f"\n  {Colors.DIM}Available storage accounts:{Colors.RESET}")
-            for sa in sa_list:
-                print(f"    {Colors.AZURE_ACCENT}-{Colors.RESET} {sa}")
-            print()
+            if sa_list:
+                print(f"\n  {Colors.DIM}Available storage accounts:{Colors.RESET}")
+                for sa in sa_list:
+                    print(f"    {Colors.AZURE_ACCENT}-{Colors.RESET} {sa}")
+                print()
+        else:
+            print(f"  {Colors.DIM}(pass --list-existing to list available storage accounts){Colors.RESET}")
 
         account_name = prompt_storage_account_name("Storage Account Name")
 
         # Verify it exists
-        if not storage_account_exists(storage_client, resource_group, account_name):
+        if not sa_exists(account_name):
             print(f"  {Colors.WARN}! Storage account '{account_name}' not found{Colors.RESET}")
             if prompt_yes_no("Create it?", True):
                 sa_action = "create"  # Fall through to create logic
@@ -573,7 +1247,7 @@ def main():
             location = rg_location
 
         # Check if already exists
-        if storage_account_exists(storage_client, resource_group, account_name):
+        if sa_exists(account_name):
             print(f"  {Colors.INFO}Storage account '{account_name}' already exists{Colors.RESET}")
             sa_created = False
         else:
@@ -586,6 +1260,7 @@ def main():
                     enable_hns=enable_hns
                 )
                 sp.stop(success=True, message=f"Created storage account '{account_name}'")
+                sa_exists_cache[account_name] = True
                 sa_created = True
             except Exception as e:
                 sp.stop(success=False, message=f"Failed: {e}")
@@ -602,13 +1277,14 @@ def main():
     sp.start()
     try:
         keys = storage_client.storage_accounts.list_keys(resource_group, account_name)
-        account_key = keys.keys[0].value
-        blob_service = BlobServiceClient(account_url=account_url, credential=account_key)
-        sp.stop(success=True, message="Using account key for blob access")
+        blob_credential = create_account_sas(account_name, keys.keys[0].value)
+        blob_service = get_blob_service(account_url, blob_credential)
+        sp.stop(success=True, message="Using account SAS for blob access")
     except Exception as e:
         # Fall back to DefaultAzureCredential if we can't get keys
         sp.stop(success=False, message=f"Could not get keys, using credential: {e}")
-        blob_service = BlobServiceClient(account_url=account_url, credential=credential)
+        blob_credential = credential
+        blob_service = get_blob_service(account_url, blob_credential)
 
     # ---------------------------------------------------------------------------
     # Container
@@ -616,32 +1292,35 @@ def main():
     container_action = prompt_create_or_use("Container")
 
     if container_action == "existing":
-        # List existing containers
-        sp = Spinner("Fetching containers")
-        sp.start()
-        try:
-            container_list = list_containers(blob_service)
-            sp.stop(success=True, message=f"Found {len(container_list)} containers")
-
-            if container_list:
-                print(f"\n  {Colors.DIM}Available containers:{Colors.RESET}")
-                for c in container_list:
-                    print(f"    {Colors.AZURE_ACCENT}-{Colors.RESET} {c}")
-                print()
-        except Exception as e:
-            sp.stop(success=False, message="Could not list containers")
-            container_list = []
-            error_msg = str(e)
-            if "AuthorizationFailure" in error_msg or "not authorized" in error_msg.lower():
-                print(f"\n  {Colors.WARN}! Authorization error listing containers.{Colors.RESET}")
-                print(f"  {Colors.DIM}This usually means your credential lacks data plane permissions.{Colors.RESET}")
-                print(f"  {Colors.DIM}Required role: 'Storage Blob Data Contributor' or 'Storage Blob Data Reader'{Colors.RESET}")
-                print(f"  {Colors.DIM}Assign via: az role assignment create --assignee <your-user-or-sp> \\{Colors.RESET}")
-                print(f"  {Colors.DIM}  --role \"Storage Blob Data Contributor\" --scope /subscriptions/<sub>/resourceGroups/<rg>/providers/Microsoft.Storage/storageAccounts/{account_name}{Colors.RESET}")
-                print(f"\n  {Colors.INFO}You can still enter a container name manually.{Colors.RESET}\n")
-            else:
-                print(f"\n  {Colors.WARN}! Error: {e}{Colors.RESET}")
-                print(f"  {Colors.INFO}You can still enter a container name manually.{Colors.RESET}\n")
+        if args.list_existing:
+            # List existing containers
+            sp = Spinner("Fetching containers")
+            sp.start()
+            try:
+                container_list = list_containers(blob_service)
+                sp.stop(success=True, message=f"Found {len(container_list)} containers")
+
+                if container_list:
+                    print(f"\n  {Colors.DIM}Available containers:{Colors.RESET}")
+                    for c in container_list:
+                        print(f"    {Colors.AZURE_ACCENT}-{Colors.RESET} {c}")
+                    print()
+            except Exception as e:
+                sp.stop(success=False, message="Could not list containers")
+                container_list = []
+                error_msg = str(e)
+                if "AuthorizationFailure" in error_msg or "not authorized" in error_msg.lower():
+                    print(f"\n  {Colors.WARN}! Authorization error listing containers.{Colors.RESET}")
+                    print(f"  {Colors.DIM}This usually means your credential lacks data plane permissions.{Colors.RESET}")
+                    print(f"  {Colors.DIM}Required role: 'Storage Blob Data Contributor' or 'Storage Blob Data Reader'{Colors.RESET}")
+                    print(f"  {Colors.DIM}Assign via: az role assignment create --assignee <your-user-or-sp> \\{Colors.RESET}")
+                    print(f"  {Colors.DIM}  --role \"Storage Blob Data Contributor\" --scope /subscriptions/<sub>/resourceGroups/<rg>/providers/Microsoft.Storage/storageAccounts/{account_name}{Colors.RESET}")
+                    print(f"\n  {Colors.INFO}You can still enter a container name manually.{Colors.RESET}\n")
+                else:
+                    print(f"\n  {Colors.WARN}! Error: {e}{Colors.RESET}")
+                    print(f"  {Colors.INFO}You can still enter a container name manually.{Colors.RESET}\n")
+        else:
+            print(f"  {Colors.DIM}(pass --list-existing to list available containers){Colors.RESET}")
 
         container_name = prompt_container_name("Container Name")
 
@@ -669,30 +1348,29 @@ def main():
         container_name = prompt_container_name("Container Name", "data")
 
     if container_action == "create":
-        if container_exists(blob_service, container_name):
-            print(f"  {Colors.INFO}Container '{container_name}' already exists{Colors.RESET}")
-            container_created = False
-        else:
-            sp = Spinner(f"Creating container '{container_name}'")
-            sp.start()
-            try:
-                create_container(blob_service, container_name)
+        sp = Spinner(f"Creating container '{container_name}'")
+        sp.start()
+        try:
+            container_created = create_container(blob_service, container_name)
+            if container_created:
                 sp.stop(success=True, message=f"Created container '{container_name}'")
-                container_created = True
-            except Exception as e:
-                sp.stop(success=False, message=f"Failed: {e}")
-                sys.exit(1)
+            else:
+                sp.stop(success=True, message=f"Container '{container_name}' already exists")
+        except Exception as e:
+            sp.stop(success=False, message=f"Failed: {e}")
+            sys.exit(1)
 
     # ---------------------------------------------------------------------------
     # Hash Prefix Configuration
     # ---------------------------------------------------------------------------
     print(f"\n  {Colors.AZURE_LIGHT}Hash Prefix Settings{Colors.RESET}")
-    print(f"  {Colors.DIM}Hash prefixes improve partition distribution (e.g., aa/bb/file.txt){Colors.RESET}\n")
+    print(f"  {Colors.DIM}Hash prefixes improve partition distribution (e.g., aa/bb/file.txt){Colors.RESET}")
+    print(f"  {Colors.DIM}Prefix mode: {PREFIX_MODE} (set PREFIX_MODE=name|content){Colors.RESET}\n")
 
     prefix_depth = prompt_int("Prefix Depth (directory levels)", 2, 1, 8)
     chars_per_level = prompt_int("Characters Per Level", 2, 1, 4)
 
-    # Show example
+    # Show example (content mode hashes file bytes, so this is illustrative only)
     example_prefix = generate_hash_prefix("example_file.parquet", prefix_depth, chars_per_level)
     print(f"\n  {Colors.DIM}Example: example_file.parquet -> {example_prefix}example_file.parquet{Colors.RESET}")
 
@@ -706,28 +1384,31 @@ def main():
     if not source_dir:
         # Generate test files
         temp_dir = tempfile.mkdtemp(prefix="azure_test_")
-        print(f"\n  {Colors.INFO}Generating 100 test files in {temp_dir}{Colors.RESET}")
+        print(f"\n  {Colors.INFO}Generating {args.test_files} test files in {temp_dir}{Colors.RESET}")
 
         sp = Spinner("Generating test files")
         sp.start()
-        test_files = generate_test_files(temp_dir, 100)
+        test_files = generate_test_files(temp_dir, args.test_files)
         sp.stop(success=True, message=f"Generated {len(test_files)} test files")
         source_dir = temp_dir
+        files_to_upload = [Path(p) for p in test_files]
     else:
         # Validate directory exists
         if not os.path.isdir(source_dir):
             print(f"  {Colors.ERROR}! Directory not found: {source_dir}{Colors.RESET}")
             sys.exit(1)
 
-        # Check for files
-        files = [f for f in Path(source_dir).iterdir() if f.is_file()]
-        if not files:
+        # Check for files; this listing is reused for the upload
+        files_to_upload = list_files(source_dir)
+        if not files_to_upload:
             print(f"  {Colors.WARN}! No files found in {source_dir}{Colors.RESET}")
-            if prompt_yes_no("Generate 100 test files instead?", True):
+            if prompt_yes_no(f"Generate {args.test_files} test files instead?", True):
                 sp = Spinner("Generating test files")
                 sp.start()
-                test_files = generate_test_files(source_dir, 100)
+                test_files = generate_test_files(source_dir, args.test_files)
                 sp.stop(success=True, message=f"Generated {len(test_files)} test files")
+                # The directory held no files, so the generated ones are all of them
+                files_to_upload = [Path(p) for p in test_files]
             else:
                 print(f"  {Colors.ERROR}! No files to upload{Colors.RESET}")
                 sys.exit(1)
@@ -735,39 +1416,105 @@ def main():
     # ---------------------------------------------------------------------------
     # Upload Files
     # ---------------------------------------------------------------------------
-    files_to_upload = [f for f in Path(source_dir).iterdir() if f.is_file()]
     total_files = len(files_to_upload)
 
+    concurrency = ASYNC_UPLOAD_CONCURRENCY if args.use_async else UPLOAD_CONCURRENCY
+    mode = "async uploads" if args.use_async else "parallel workers"
+
     print(f"\n  {Colors.AZURE_LIGHT}Uploading {total_files} files with hash prefixes{Colors.RESET}")
-    print(f"  {Colors.DIM}Using overwrite=True for idempotent uploads{Colors.RESET}\n")
+    print(f"  {Colors.DIM}Using overwrite=True for idempotent uploads, {concurrency} {mode}{Colors.RESET}\n")
+
+    use_bundle = args.bundle and should_bundle([str(filepath) for filepath in files_to_upload])
+    if args.bundle and not use_bundle:
+        print(f"  {Colors.WARN}! Not bundling: needs at least 2 files averaging under "
+              f"BUNDLE_THRESHOLD ({BUNDLE_THRESHOLD_BYTES} bytes); uploading files individually{Colors.RESET}\n")
 
     if prompt_yes_no("Proceed with upload?", True):
         uploaded_files = []
+        skipped_files = []
         errors = []
-
-        for i, filepath in enumerate(files_to_upload):
-            progress = f"[{i + 1}/{total_files}]"
-            sys.stdout.write(f"\r  {Colors.AZURE_ACCENT}{progress}{Colors.RESET} Uploading {filepath.name[:40]}...")
+        bundled_count = 0
+
+        last_draw = 0.0
+
+        def show_progress(done: int, total: int, filename: str):
+            nonlocal last_draw
+            # Throttle redraws by time so both many small and few large files update sensibly
+            now = time.monotonic()
+            if now - last_draw < PROGRESS_INTERVAL and done != total:
+                return
+            last_draw = now
+            progress = f"[{done}/{total}]"
+            sys.stdout.write(f"\r  {Colors.AZURE_ACCENT}{progress}{Colors.RESET} {filename[:40]}...")
             sys.stdout.flush()
 
+        if use_bundle:
+            sp = Spinner(f"Bundling {total_files} small files")
+            sp.start()
             try:
-                result = upload_file_with_prefix(
-                    blob_service,
-                    container_name,
-                    str(filepath),
+                bundle_blob, manifest_blob = upload_bundle(
+                    blob_service.get_container_client(container_name),
+                    [str(filepath) for filepath in files_to_upload],
                     prefix_depth,
                     chars_per_level
                 )
-                uploaded_files.append(result)
+                sp.stop(success=True, message=f"Uploaded bundle {bundle_blob}")
+                # Only the tar and its manifest exist as blobs
+                uploaded_files = [(source_dir, bundle_blob), (source_dir, manifest_blob)]
+                bundled_count = total_files
             except Exception as e:
-                errors.append((filepath.name, str(e)))
+                sp.stop(success=False, message=f"Bundle upload failed: {e}")
+                errors.append((f"{total_files} bundled files", str(e)))
+        elif args.use_async:
+            uploaded_files, skipped_files, errors = asyncio.run(upload_files_async(
+                account_url,
+                blob_credential,
+                container_name,
+                [str(filepath) for filepath in files_to_upload],
+                prefix_depth,
+                chars_per_level,
+                progress_callback=show_progress,
+                skip_unchanged=args.skip_unchanged
+            ))
+        else:
+            blob_names = precompute_blob_names(
+                [str(filepath) for filepath in files_to_upload], prefix_depth, chars_per_level
+            )
+            container_client = blob_service.get_container_client(container_name)
+            with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as executor:
+                futures = {
+                    executor.submit(
+                        upload_file_with_prefix,
+                        container_client,
+                        str(filepath),
+                        prefix_depth,
+                        chars_per_level,
+                        blob_name,
+                        args.skip_unchanged
+                    ): filepath
+                    for filepath, blob_name in zip(files_to_upload, blob_names)
+                }
+
+                for i, future in enumerate(as_completed(futures)):
+                    filepath = futures[future]
+                    try:
+                        local_path, blob_name, was_skipped = future.result()
+                        (skipped_files if was_skipped else uploaded_files).append((local_path, blob_name))
+                    except Exception as e:
+                        errors.append((filepath.name, str(e)))
+                    show_progress(i + 1, total_files, filepath.name)
 
         # Clear the line
         sys.stdout.write('\r' + ' ' * 80 + '\r')
         sys.stdout.flush()
 
-        if uploaded_files:
-            print(f"  {Colors.SUCCESS}+ Uploaded {len(uploaded_files)} files{Colors.RESET}")
+        if bundled_count:
+            print(f"  {Colors.SUCCESS}+ Bundled {bundled_count} files into {len(uploaded_files)} blobs{Colors.RESET}")
+        elif uploaded_files or skipped_files:
+            result = f"+ Uploaded {len(uploaded_files)} files"
+            if skipped_files:
+                result += f", skipped {len(skipped_files)} unchanged"
+            print(f"  {Colors.SUCCESS}{result}{Colors.RESET}")
 
         if errors:
             print(f"  {Colors.ERROR}! {len(errors)} files failed to upload{Colors.RESET}")
@@ -780,22 +1527,26 @@ def main():
     # ---------------------------------------------------------------------------
     # Summary
     # ---------------------------------------------------------------------------
-    print(f"\n  {Colors.AZURE_MID}{'=' * 50}{Colors.RESET}")
-    print(f"  {Colors.AZURE_LIGHT}Summary{Colors.RESET}\n")
-
-    print(f"  {Colors.AZURE_MID}Resource Group{Colors.RESET}   {resource_group}")
-    print(f"  {Colors.AZURE_MID}Storage Account{Colors.RESET}  {account_name}")
-    print(f"  {Colors.AZURE_MID}Container{Colors.RESET}        {container_name}")
-    print(f"  {Colors.AZURE_MID}Prefix Format{Colors.RESET}    {prefix_depth} levels, {chars_per_level} chars each")
+    # Collected into one write
+    lines = [
+        f"\n  {Colors.AZURE_MID}{'=' * 50}{Colors.RESET}",
+        f"  {Colors.AZURE_LIGHT}Summary{Colors.RESET}\n",
+        f"  {Colors.AZURE_MID}Resource Group{Colors.RESET}   {resource_group}",
+        f"  {Colors.AZURE_MID}Storage Account{Colors.RESET}  {account_name}",
+        f"  {Colors.AZURE_MID}Container{Colors.RESET}        {container_name}",
+        f"  {Colors.AZURE_MID}Prefix Format{Colors.RESET}    {prefix_depth} levels, {chars_per_level} chars each ({PREFIX_MODE} hash)",
+    ]
 
     if uploaded_files:
-        print(f"\n  {Colors.AZURE_MID}Sample uploaded blobs:{Colors.RESET}")
+        lines.append(f"\n  {Colors.AZURE_MID}Sample uploaded blobs:{Colors.RESET}")
         for local_path, blob_name in uploaded_files[:5]:
-            print(f"    {Colors.AZURE_ACCENT}->{Colors.RESET} {blob_name}")
+            lines.append(f"    {Colors.AZURE_ACCENT}->{Colors.RESET} {blob_name}")
         if len(uploaded_files) > 5:
-            print(f"    {Colors.DIM}... and {len(uploaded_files) - 5} more{Colors.RESET}")
+            lines.append(f"    {Colors.DIM}... and {len(uploaded_files) - 5} more{Colors.RESET}")
 
-    print(f"\n  {Colors.SUCCESS}Done.{Colors.RESET}\n")
+    lines.append(f"\n  {Colors.SUCCESS}Done.{Colors.RESET}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":